@@ -19,8 +19,15 @@ def build_dependencies_graph(project: Project) -> DepencenciesGraph:  # noqa: PL
     successors_dd: defaultdict[ProjectPath, set[ProjectPath]] = defaultdict(set)
 
     for scope_name, scope in project.scopes.items():
-        for calc_name, calc in scope.calculations.items():
-            for dep_ppath in calc.dep_ppaths.values():
+        for calc_name, calc in scope.calculation_items:
+            dst_leaf_ppaths = tuple(
+                ProjectPath(
+                    scope=scope_name,
+                    path=CalcPath(root=f"@{calc_name}", parts=dst_leaf_parts),
+                )
+                for dst_leaf_parts in iter_leaf_path_parts(calc.output_type)
+            )
+            for _dep_name, dep_ppath in calc.dep_ppath_items:
                 dep_type = project.get_type(dep_ppath)
                 for src_leaf_parts in iter_leaf_path_parts(dep_type):
                     src_leaf_abs_parts = dep_ppath.path.parts + src_leaf_parts
@@ -36,16 +43,12 @@ def build_dependencies_graph(project: Project) -> DepencenciesGraph:  # noqa: PL
                         scope=dep_ppath.scope,
                         path=src_leaf_path,
                     )
-                    for dst_leaf_parts in iter_leaf_path_parts(calc.output_type):
-                        dst_leaf_ppath = ProjectPath(
-                            scope=scope_name,
-                            path=CalcPath(root=f"@{calc_name}", parts=dst_leaf_parts),
-                        )
+                    for dst_leaf_ppath in dst_leaf_ppaths:
                         predecessors_dd[dst_leaf_ppath].add(src_leaf_ppath)
                         successors_dd[src_leaf_ppath].add(dst_leaf_ppath)
 
-        for verif_name, verif in scope.verifications.items():
-            for dep_ppath in verif.dep_ppaths.values():
+        for verif_name, verif in scope.verification_items:
+            for _dep_name, dep_ppath in verif.dep_ppath_items:
                 dep_type = project.get_type(dep_ppath)
                 for src_leaf_parts in iter_leaf_path_parts(dep_type):
                     src_leaf_abs_parts = dep_ppath.path.parts + src_leaf_parts
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleData:
     """Module data for a Python module."""
 
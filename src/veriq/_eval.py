@@ -5,11 +5,12 @@ from ._build import build_dependencies_graph
 from ._path import (
     CalcPath,
     ModelPath,
+    PartBase,
     ProjectPath,
     VerificationPath,
-    get_value_by_parts,
     hydrate_value_by_leaf_values,
     iter_leaf_path_parts,
+    iter_leaf_values,
 )
 from ._utils import topological_sort
 
@@ -25,14 +26,52 @@ logger = logging.getLogger(__name__)
 
 def evaluate_project(project: Project, model_data: Mapping[str, BaseModel]) -> dict[ProjectPath, Any]:  # noqa: C901
     result: dict[ProjectPath, Any] = {}
+
+    # The leaf structure of a dependency is static for a given project, so
+    # resolve it once per distinct dependency path and share it across all
+    # calculations/verifications that reference the same path.
+    dep_specs: dict[ProjectPath, tuple[type, tuple[tuple[tuple[PartBase, ...], ProjectPath], ...]]] = {}
+
+    def dep_spec(dep_ppath: ProjectPath) -> tuple[type, tuple[tuple[tuple[PartBase, ...], ProjectPath], ...]]:
+        spec = dep_specs.get(dep_ppath)
+        if spec is None:
+            dep_type = project.get_type(dep_ppath)
+            dep_path = dep_ppath.path
+            is_calc = isinstance(dep_path, CalcPath)
+            leaf_specs = tuple(
+                (
+                    leaf_parts,
+                    ProjectPath(
+                        scope=dep_ppath.scope,
+                        path=CalcPath(root=dep_path.root, parts=dep_path.parts + leaf_parts)
+                        if is_calc
+                        else ModelPath(root="$", parts=dep_path.parts + leaf_parts),
+                    ),
+                )
+                for leaf_parts in iter_leaf_path_parts(dep_type)
+            )
+            spec = (dep_type, leaf_specs)
+            dep_specs[dep_ppath] = spec
+        return spec
+
+    def hydrate_inputs(dep_ppath_items: tuple[tuple[str, ProjectPath], ...]) -> dict[str, Any]:
+        input_values: dict[str, Any] = {}
+        for dep_name, dep_ppath in dep_ppath_items:
+            logger.debug(f"  Hydrating input '{dep_name}' from {dep_ppath}")
+            dep_type, leaf_specs = dep_spec(dep_ppath)
+            input_values[dep_name] = hydrate_value_by_leaf_values(
+                dep_type,
+                {leaf_parts: result[leaf_ppath] for leaf_parts, leaf_ppath in leaf_specs},
+            )
+        return input_values
+
     for scope_name, scope_data in model_data.items():
         root_model = project.scopes[scope_name].get_root_model()
-        for leaf_path_parts in iter_leaf_path_parts(root_model):
+        for leaf_path_parts, value in iter_leaf_values(root_model, scope_data):
             leaf_path = ProjectPath(
                 scope=scope_name,
                 path=ModelPath(root="$", parts=leaf_path_parts),
             )
-            value = get_value_by_parts(scope_data, leaf_path_parts)
             result[leaf_path] = value
 
     logger.debug("Result after hydrated with model data:")
@@ -47,60 +86,24 @@ def evaluate_project(project: Project, model_data: Mapping[str, BaseModel]) -> d
             continue
         logger.debug(f"Evaluating {ppath}")
 
-        predecessors = dependencies_graph.predecessors[ppath]
-        predecessor_values = {pred_ppath: result[pred_ppath] for pred_ppath in predecessors}
-
         if isinstance(ppath.path, CalcPath):
             calc_scope = project.scopes[ppath.scope]
             calc = calc_scope.calculations[ppath.path.calc_name]
-            input_values: dict[str, Any] = {}
-            for dep_name, dep_ppath in calc.dep_ppaths.items():
-                logger.debug(f"  Hydrating input '{dep_name}' from {dep_ppath}")
-                input_values[dep_name] = hydrate_value_by_leaf_values(
-                    project.get_type(dep_ppath),
-                    {
-                        leaf_parts: predecessor_values[
-                            ProjectPath(
-                                scope=dep_ppath.scope,
-                                path=CalcPath(root=dep_ppath.path.root, parts=dep_ppath.path.parts + leaf_parts)
-                                if isinstance(dep_ppath.path, CalcPath)
-                                else ModelPath(root="$", parts=dep_ppath.path.parts + leaf_parts),
-                            )
-                        ]
-                        for leaf_parts in iter_leaf_path_parts(project.get_type(dep_ppath))
-                    },
-                )
+            input_values = hydrate_inputs(calc.dep_ppath_items)
             logger.debug(f"  Calling calculation {calc.name} with inputs: {input_values}")
             calc_output = calc.func(**input_values)
             logger.debug(f"  Calculation output: {calc_output!r}")
-            for leaf_parts in iter_leaf_path_parts(calc.output_type):
+            for leaf_parts, value in iter_leaf_values(calc.output_type, calc_output):
                 leaf_ppath = ProjectPath(
                     scope=ppath.scope,
                     path=CalcPath(root=ppath.path.root, parts=leaf_parts),
                 )
-                value = get_value_by_parts(calc_output, leaf_parts)
                 logger.debug(f"    Setting output leaf {leaf_ppath} = {value!r}")
                 result[leaf_ppath] = value
         elif isinstance(ppath.path, VerificationPath):
             verif_scope = project.scopes[ppath.scope]
             verif = verif_scope.verifications[ppath.path.verification_name]
-            input_values = {}
-            for dep_name, dep_ppath in verif.dep_ppaths.items():
-                logger.debug(f"  Hydrating input '{dep_name}' from {dep_ppath}")
-                input_values[dep_name] = hydrate_value_by_leaf_values(
-                    project.get_type(dep_ppath),
-                    {
-                        leaf_parts: predecessor_values[
-                            ProjectPath(
-                                scope=dep_ppath.scope,
-                                path=CalcPath(root=dep_ppath.path.root, parts=dep_ppath.path.parts + leaf_parts)
-                                if isinstance(dep_ppath.path, CalcPath)
-                                else ModelPath(root="$", parts=dep_ppath.path.parts + leaf_parts),
-                            )
-                        ]
-                        for leaf_parts in iter_leaf_path_parts(project.get_type(dep_ppath))
-                    },
-                )
+            input_values = hydrate_inputs(verif.dep_ppath_items)
             logger.debug(f"  Calling verification {verif.name} with inputs: {input_values}")
             verif_result = verif.func(**input_values)
             logger.debug(f"  Verification result: {verif_result!r}")
@@ -80,19 +80,19 @@ def _parts_to_keys(parts: tuple[PartBase, ...]) -> list[str]:
     """Convert path parts to a list of keys for nested dictionary access."""
     keys: list[str] = []
     for part in parts:
-        match part:
-            case AttributePart(name):
-                keys.append(name)
-            case ItemPart(key):
-                # For Table items, use the key directly as a dictionary key
-                if isinstance(key, tuple):
-                    # Multi-key access (though not common in this context)
-                    keys.append(",".join(key))
-                else:
-                    keys.append(key)
-            case _:
-                msg = f"Unknown part type: {type(part)}"
-                raise TypeError(msg)
+        if type(part) is AttributePart:
+            keys.append(part.name)
+        elif type(part) is ItemPart:
+            # For Table items, use the key directly as a dictionary key
+            key = part.key
+            if isinstance(key, tuple):
+                # Multi-key access (though not common in this context)
+                keys.append(",".join(key))
+            else:
+                keys.append(key)
+        else:
+            msg = f"Unknown part type: {type(part)}"
+            raise TypeError(msg)
     return keys
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
 from annotationlib import ForwardRef
@@ -7,10 +8,19 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, get_args, get_origin
 
 from pydantic import BaseModel
-from scoped_context import NoContextError, ScopedContext
+from scoped_context import ScopedContext
 from typing_extensions import _AnnotatedAlias
 
-from ._path import AttributePart, CalcPath, ItemPart, ModelPath, ProjectPath, VerificationPath, parse_path
+from ._path import (
+    AttributePart,
+    CalcPath,
+    ItemPart,
+    ModelPath,
+    ProjectPath,
+    VerificationPath,
+    iter_leaf_path_parts,
+    parse_path,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Iterable
@@ -25,12 +35,14 @@ def _get_dep_refs_from_signature(sig: inspect.Signature) -> dict[str, Ref]:
         name: str,
         annotations: _AnnotatedAlias,
     ) -> Ref | None:
-        args = get_args(annotations)
-        try:
-            return next(iter(arg for arg in args if isinstance(arg, Ref)))
-        except StopIteration:
-            msg = f"Parameter '{name}' must be annotated with Fetch or Calc."
-            raise TypeError(msg) from None
+        # For Annotated aliases the metadata is available directly; get_args would
+        # rebuild the full (origin, *metadata) tuple on every parameter.
+        if type(annotations) is _AnnotatedAlias:
+            for arg in annotations.__metadata__:
+                if isinstance(arg, Ref):
+                    return arg
+        msg = f"Parameter '{name}' must be annotated with Fetch or Calc."
+        raise TypeError(msg)
 
     return {
         param.name: dep
@@ -39,6 +51,55 @@ def _get_dep_refs_from_signature(sig: inspect.Signature) -> dict[str, Ref]:
     }
 
 
+# Shared by all dependency-free functions; never mutated.
+_EMPTY_DEP_REFS: dict[str, Ref] = {}
+
+
+@functools.cache
+def _signature_and_dep_refs(func: Callable[..., Any]) -> tuple[inspect.Signature, dict[str, Ref]]:
+    """Resolve the signature and dependency refs of a function, memoized per function."""
+    sig = inspect.signature(func)
+    if not sig.parameters:
+        return sig, _EMPTY_DEP_REFS
+    return sig, _get_dep_refs_from_signature(sig)
+
+
+def _walk_type_by_parts(current_type: type, parts: tuple[Any, ...]) -> type:
+    """Walk a type through a sequence of path parts, resolving forward references."""
+    for part in parts:
+        if isinstance(current_type, ForwardRef):
+            current_type = current_type.evaluate()
+        part_type = type(part)
+        if part_type is AttributePart:
+            name = part.name
+            if not issubclass(current_type, BaseModel):
+                msg = f"Type '{current_type}' is not a Pydantic model."
+                raise TypeError(msg)
+            try:
+                field_info = current_type.model_fields[name]
+            except KeyError as e:
+                msg = f"Attribute '{name}' not found in model '{current_type.__name__}'."
+                raise KeyError(msg) from e
+            if field_info.annotation is None:
+                msg = f"Attribute '{name}' in model '{current_type.__name__}' has no type annotation."
+                raise TypeError(msg)
+            current_type = field_info.annotation
+        elif part_type is ItemPart:
+            args = get_args(current_type)
+            if len(args) != 2:
+                msg = f"Type '{current_type}' is not subscriptable with key '{part.key}'."
+                raise TypeError(msg)
+            current_type = args[1]
+        else:
+            msg = f"Unknown part type: {part_type}"
+            raise TypeError(msg)
+
+    if isinstance(current_type, ForwardRef):
+        current_type = current_type.evaluate()
+
+    return current_type
+
+
 def _get_return_type_from_signature(sig: inspect.Signature) -> type:
     """Extract return type from the function signature."""
     return_annotation = sig.return_annotation
@@ -62,6 +123,7 @@ class Project:
 
     name: str
     _scopes: dict[str, Scope] = field(default_factory=dict)
+    _type_cache: dict[ProjectPath, type] = field(default_factory=dict, repr=False)
 
     def add_scope(self, scope: Scope) -> None:
         """Add a scope to the project."""
@@ -69,52 +131,33 @@ class Project:
             msg = f"Scope with name '{scope.name}' already exists in the project."
             raise KeyError(msg)
         self._scopes[scope.name] = scope
+        self._type_cache.clear()
 
     @property
     def scopes(self) -> dict[str, Scope]:
         """Get all scopes in the project."""
         return self._scopes
 
-    def get_type(self, ppath: ProjectPath) -> type:  # noqa: C901,PLR0915,PLR0912
-        """Get the type of the given project path."""
+    def get_type(self, ppath: ProjectPath) -> type:
+        """Get the type of the given project path.
+
+        Results are cached per path; the cache is cleared when a scope is added.
+        """
+        try:
+            return self._type_cache[ppath]
+        except KeyError:
+            resolved = self._get_type_uncached(ppath)
+            self._type_cache[ppath] = resolved
+            return resolved
+
+    def _get_type_uncached(self, ppath: ProjectPath) -> type:
         scope = self._scopes.get(ppath.scope)
         if scope is None:
             msg = f"Scope '{ppath.scope}' not found in project '{self.name}'."
             raise KeyError(msg)
 
         if isinstance(ppath.path, ModelPath):
-            current_type: type = scope.get_root_model()
-            for part in ppath.path.parts:
-                if isinstance(current_type, ForwardRef):
-                    current_type = current_type.evaluate()
-                match part:
-                    case AttributePart(name):
-                        if not issubclass(current_type, BaseModel):
-                            msg = f"Type '{current_type}' is not a Pydantic model."
-                            raise TypeError(msg)
-                        try:
-                            field_info = current_type.model_fields[name]
-                        except KeyError as e:
-                            msg = f"Attribute '{name}' not found in model '{current_type.__name__}'."
-                            raise KeyError(msg) from e
-                        if field_info.annotation is None:
-                            msg = f"Attribute '{name}' in model '{current_type.__name__}' has no type annotation."
-                            raise TypeError(msg)
-                        current_type = field_info.annotation
-                    case ItemPart(key):
-                        args = get_args(current_type)
-                        if len(args) != 2:
-                            msg = f"Type '{current_type}' is not subscriptable with key '{key}'."
-                            raise TypeError(msg)
-                        current_type = args[1]
-                    case _:
-                        msg = f"Unknown part type: {type(part)}"
-                        raise TypeError(msg)
-
-            if isinstance(current_type, ForwardRef):
-                current_type = current_type.evaluate()
-
-            return current_type
+            return _walk_type_by_parts(scope.get_root_model(), ppath.path.parts)
 
         if isinstance(ppath.path, CalcPath):
             calc_name = ppath.path.root.lstrip(ppath.path.PREFIX)
@@ -122,36 +165,7 @@ class Project:
             if calculation is None:
                 msg = f"Calculation '{calc_name}' not found in scope '{scope.name}'."
                 raise KeyError(msg)
-            current_type = calculation.output_type
-            for part in ppath.path.parts:
-                if isinstance(current_type, ForwardRef):
-                    current_type = current_type.evaluate()
-                match part:
-                    case AttributePart(name):
-                        if not issubclass(current_type, BaseModel):
-                            msg = f"Type '{current_type}' is not a Pydantic model."
-                            raise TypeError(msg)
-                        try:
-                            field_info = current_type.model_fields[name]
-                        except KeyError as e:
-                            msg = f"Attribute '{name}' not found in model '{current_type.__name__}'."
-                            raise KeyError(msg) from e
-                        if field_info.annotation is None:
-                            msg = f"Attribute '{name}' in model '{current_type.__name__}' has no type annotation."
-                            raise TypeError(msg)
-                        current_type = field_info.annotation
-                    case ItemPart(key):
-                        args = get_args(current_type)
-                        if len(args) != 2:
-                            msg = f"Type '{current_type}' is not subscriptable with key '{key}'."
-                            raise TypeError(msg)
-                        current_type = args[1]
-                    case _:
-                        msg = f"Unknown part type: {type(part)}"
-                        raise TypeError(msg)
-            if isinstance(current_type, ForwardRef):
-                current_type = current_type.evaluate()
-            return current_type
+            return _walk_type_by_parts(calculation.output_type, ppath.path.parts)
 
         if isinstance(ppath.path, VerificationPath):
             return bool
@@ -175,33 +189,49 @@ class Calculation[T, **P]:
     name: str
     func: Callable[P, T] = field(repr=False)
     default_scope_name: str = field()
-    imported_scope_names: list[str] = field(default_factory=list)
+    imported_scope_names: tuple[str, ...] = field(default=())
     assumed_verifications: list[Verification[...]] = field(default_factory=list)
 
     # Fields initialized in __post_init__
-    dep_ppaths: dict[str, ProjectPath] = field(init=False)
+    _dep_refs: dict[str, Ref] = field(init=False, repr=False)
+    _dep_ppaths: dict[str, ProjectPath] | None = field(default=None, init=False, repr=False)
+    _dep_ppath_items: tuple[tuple[str, ProjectPath], ...] | None = field(default=None, init=False, repr=False)
     output_type: type[T] = field(init=False)
 
     def __post_init__(self) -> None:
-        sig = inspect.signature(self.func)
-        dep_refs = _get_dep_refs_from_signature(sig)
-
-        def ref_to_project_path(ref: Ref) -> ProjectPath:
-            scope_name = self.default_scope_name if ref.scope is None else ref.scope
-            return ProjectPath(scope=scope_name, path=parse_path(ref.path))
+        sig, dep_refs = _signature_and_dep_refs(self.func)
 
         for dep_name, dep_ref in dep_refs.items():
-            if dep_ref.scope is None:
-                dep_ref.scope = self.default_scope_name
-            if dep_ref.scope != self.default_scope_name and dep_ref.scope not in self.imported_scope_names:
+            dep_scope = self.default_scope_name if dep_ref.scope is None else dep_ref.scope
+            if dep_scope != self.default_scope_name and dep_scope not in self.imported_scope_names:
                 msg = (
-                    f"Dependency '{dep_name}' is from scope '{dep_ref.scope}',"
+                    f"Dependency '{dep_name}' is from scope '{dep_scope}',"
                     f" which is not imported in calculation '{self.name}'."
                 )
                 raise ValueError(msg)
-        self.dep_ppaths = {name: ref_to_project_path(ref) for name, ref in dep_refs.items()}
+        self._dep_refs = dep_refs
         self.output_type = _get_return_type_from_signature(sig)
 
+    @property
+    def dep_ppaths(self) -> dict[str, ProjectPath]:
+        """Dependency project paths, parsed lazily on first access."""
+        if self._dep_ppaths is None:
+            self._dep_ppaths = {
+                name: ProjectPath(
+                    scope=self.default_scope_name if ref.scope is None else ref.scope,
+                    path=parse_path(ref.path),
+                )
+                for name, ref in self._dep_refs.items()
+            }
+        return self._dep_ppaths
+
+    @property
+    def dep_ppath_items(self) -> tuple[tuple[str, ProjectPath], ...]:
+        """Dependency project paths as a tuple of items, for hot-path iteration."""
+        if self._dep_ppath_items is None:
+            self._dep_ppath_items = tuple(self.dep_ppaths.items())
+        return self._dep_ppath_items
+
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         return self.func(*args, **kwargs)
 
@@ -213,31 +243,47 @@ class Verification[**P]:
     name: str
     func: Callable[P, bool] = field(repr=False)  # TODO: disallow positional-only arguments
     default_scope_name: str = field()
-    imported_scope_names: list[str] = field(default_factory=list)
+    imported_scope_names: tuple[str, ...] = field(default=())
     assumed_verifications: list[Verification[...]] = field(default_factory=list)
     xfail: bool = field(default=False, kw_only=True)
 
     # Fields initialized in __post_init__
-    dep_ppaths: dict[str, ProjectPath] = field(init=False)
+    _dep_refs: dict[str, Ref] = field(init=False, repr=False)
+    _dep_ppaths: dict[str, ProjectPath] | None = field(default=None, init=False, repr=False)
+    _dep_ppath_items: tuple[tuple[str, ProjectPath], ...] | None = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
-        sig = inspect.signature(self.func)
-        dep_refs = _get_dep_refs_from_signature(sig)
-
-        def ref_to_project_path(ref: Ref) -> ProjectPath:
-            scope_name = self.default_scope_name if ref.scope is None else ref.scope
-            return ProjectPath(scope=scope_name, path=parse_path(ref.path))
+        _sig, dep_refs = _signature_and_dep_refs(self.func)
 
         for dep_name, dep_ref in dep_refs.items():
-            if dep_ref.scope is None:
-                dep_ref.scope = self.default_scope_name
-            if dep_ref.scope != self.default_scope_name and dep_ref.scope not in self.imported_scope_names:
+            dep_scope = self.default_scope_name if dep_ref.scope is None else dep_ref.scope
+            if dep_scope != self.default_scope_name and dep_scope not in self.imported_scope_names:
                 msg = (
-                    f"Dependency '{dep_name}' is from scope '{dep_ref.scope}',"
+                    f"Dependency '{dep_name}' is from scope '{dep_scope}',"
                     f" which is not imported in verification '{self.name}'."
                 )
                 raise ValueError(msg)
-        self.dep_ppaths = {name: ref_to_project_path(ref) for name, ref in dep_refs.items()}
+        self._dep_refs = dep_refs
+
+    @property
+    def dep_ppaths(self) -> dict[str, ProjectPath]:
+        """Dependency project paths, parsed lazily on first access."""
+        if self._dep_ppaths is None:
+            self._dep_ppaths = {
+                name: ProjectPath(
+                    scope=self.default_scope_name if ref.scope is None else ref.scope,
+                    path=parse_path(ref.path),
+                )
+                for name, ref in self._dep_refs.items()
+            }
+        return self._dep_ppaths
+
+    @property
+    def dep_ppath_items(self) -> tuple[tuple[str, ProjectPath], ...]:
+        """Dependency project paths as a tuple of items, for hot-path iteration."""
+        if self._dep_ppath_items is None:
+            self._dep_ppath_items = tuple(self.dep_ppaths.items())
+        return self._dep_ppath_items
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> bool:
         return self.func(*args, **kwargs)
@@ -246,12 +292,9 @@ class Verification[**P]:
 @dataclass(slots=True)
 class Requirement(ScopedContext):
     def __post_init__(self) -> None:
-        try:
-            current_requirement = Requirement.current()
-        except NoContextError:
-            pass
-        else:
-            current_requirement.decomposed_requirements.append(self)
+        stack = Requirement.context_stack()
+        if stack:
+            stack[-1]._attach_child_requirement(self)  # noqa: SLF001
 
     id: str
     description: str
@@ -259,14 +302,22 @@ class Requirement(ScopedContext):
     verified_by: list[Verification[...]] = field(default_factory=list, repr=False)
     depends_on: list[Requirement] = field(default_factory=list, repr=False)
 
+    def _attach_child_requirement(self, requirement: Requirement) -> None:
+        """Attach a requirement as a decomposition of this requirement."""
+        self.decomposed_requirements.append(requirement)
+
     def iter_requirements(self, *, depth: int | None = None, leaf_only: bool = False) -> Iterable[Requirement]:
         """Iterate over requirements under the current requirement."""
-        if not leaf_only or not self.decomposed_requirements:
-            yield self
-        if depth is not None and depth <= 0:
-            return
-        for req in self.decomposed_requirements:
-            yield from req.iter_requirements(depth=depth - 1 if depth is not None else None, leaf_only=leaf_only)
+        stack: list[tuple[Requirement, int | None]] = [(self, depth)]
+        while stack:
+            requirement, remaining_depth = stack.pop()
+            if not leaf_only or not requirement.decomposed_requirements:
+                yield requirement
+            if remaining_depth is not None and remaining_depth <= 0:
+                continue
+            child_depth = None if remaining_depth is None else remaining_depth - 1
+            # Push in reverse to preserve the original pre-order traversal
+            stack.extend((child, child_depth) for child in reversed(requirement.decomposed_requirements))
 
 
 @dataclass(slots=True)
@@ -276,6 +327,10 @@ class Scope:
     _requirements: dict[str, Requirement] = field(default_factory=dict)
     _verifications: dict[str, Verification[...]] = field(default_factory=dict)
     _calculations: dict[str, Calculation[Any, ...]] = field(default_factory=dict)
+    # Registries are insertion-only, so iteration snapshots can be cached as
+    # tuples and invalidated on registration.
+    _verification_items: tuple[tuple[str, Verification[...]], ...] | None = field(default=None, repr=False)
+    _calculation_items: tuple[tuple[str, Calculation[Any, ...]], ...] | None = field(default=None, repr=False)
 
     def get_root_model(self) -> type[BaseModel]:
         """Get the root model of the scope."""
@@ -299,6 +354,20 @@ class Scope:
         """Get all calculations in the scope."""
         return self._calculations
 
+    @property
+    def verification_items(self) -> tuple[tuple[str, Verification[...]], ...]:
+        """Get all verifications in the scope as (name, verification) pairs."""
+        if self._verification_items is None:
+            self._verification_items = tuple(self._verifications.items())
+        return self._verification_items
+
+    @property
+    def calculation_items(self) -> tuple[tuple[str, Calculation[Any, ...]], ...]:
+        """Get all calculations in the scope as (name, calculation) pairs."""
+        if self._calculation_items is None:
+            self._calculation_items = tuple(self._calculations.items())
+        return self._calculation_items
+
     def root_model[M: type[BaseModel]](self) -> Callable[[M], M]:
         """Decorator to mark a model as the root model of the scope."""
 
@@ -307,6 +376,15 @@ class Scope:
                 msg = f"Scope '{self.name}' already has a root model assigned: {self._root_model.__name__}"
                 raise RuntimeError(msg)
             self._root_model = model
+            # Warm the per-type leaf-path cache during one-time setup so the
+            # first evaluation does no reflection. Annotations referring to
+            # classes defined later cannot be resolved yet; leave those to
+            # first use.
+            try:
+                for _ in iter_leaf_path_parts(model):
+                    pass
+            except NameError:
+                pass
             return model
 
         return decorator
@@ -336,7 +414,7 @@ class Scope:
             verification = Verification(
                 name=verification_name,
                 func=func,
-                imported_scope_names=list(imports),
+                imported_scope_names=tuple(imports),
                 assumed_verifications=assumed_verifications,
                 default_scope_name=self.name,
                 xfail=xfail,
@@ -345,6 +423,7 @@ class Scope:
                 msg = f"Verification with name '{verification_name}' already exists in scope '{self.name}'."
                 raise KeyError(msg)
             self._verifications[verification_name] = verification
+            self._verification_items = None
             return verification
 
         return decorator
@@ -372,7 +451,7 @@ class Scope:
             calculation = Calculation(
                 name=calculation_name,
                 func=func,
-                imported_scope_names=list(imports),
+                imported_scope_names=tuple(imports),
                 assumed_verifications=assumed_verifications,
                 default_scope_name=self.name,
             )
@@ -380,6 +459,7 @@ class Scope:
                 msg = f"Calculation with name '{calculation_name}' already exists in scope '{self.name}'."
                 raise KeyError(msg)
             self._calculations[calculation_name] = calculation
+            self._calculation_items = None
             return calculation
 
         return decorator
@@ -387,12 +467,16 @@ class Scope:
     def requirement(self, id_: str, /, description: str, verified_by: Iterable[Verification[...]] = ()) -> Requirement:
         """Create and add a requirement to the scope."""
         requirement = Requirement(description=description, verified_by=list(verified_by), id=id_)
-        if id_ in self._requirements:
-            msg = f"Requirement with ID '{id_}' already exists in scope '{self.name}'."
-            raise KeyError(msg)
-        self._requirements[id_] = requirement
+        self._attach_child_requirement(requirement)
         return requirement
 
+    def _attach_child_requirement(self, requirement: Requirement) -> None:
+        """Attach a requirement as a top-level requirement of this scope."""
+        if requirement.id in self._requirements:
+            msg = f"Requirement with ID '{requirement.id}' already exists in scope '{self.name}'."
+            raise KeyError(msg)
+        self._requirements[requirement.id] = requirement
+
     def fetch_requirement(self, id_: str, /) -> Requirement:
         """Fetch a requirement by its ID."""
         try:
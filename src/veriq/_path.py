@@ -1,20 +1,26 @@
 import logging
+import re
 from annotationlib import ForwardRef
+from collections import defaultdict
 from dataclasses import dataclass, field
-from enum import StrEnum
+from enum import IntEnum, StrEnum
+from functools import cache, lru_cache
 from inspect import isclass
 from itertools import product
-from typing import TYPE_CHECKING, Any, ClassVar, Self, get_args, get_origin
+from typing import TYPE_CHECKING, Any, ClassVar, Self, get_args, get_origin, get_type_hints
 
 from pydantic import BaseModel
 
 from ._table import Table
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Mapping
+    from collections.abc import Callable, Generator, Mapping
 
 logger = logging.getLogger(__name__)
 
+# One token per path part: `.attr` (group 1) or `[key]` (group 2).
+_TOKEN_RE = re.compile(r"\.([^.\[]+)|\[([^\]]+)\]")
+
 
 class PartBase:
     pass
@@ -30,71 +36,83 @@ class ItemPart(PartBase):
     key: str | tuple[str, ...]
 
 
+@lru_cache(maxsize=4096)
+def _mk_attr(name: str) -> AttributePart:
+    """Intern attribute parts; the same field names recur across many paths."""
+    return AttributePart(name=name)
+
+
+@lru_cache(maxsize=4096)
+def _mk_item(key: str | tuple[str, ...]) -> ItemPart:
+    """Intern item parts; the same table keys recur across many paths."""
+    return ItemPart(key=key)
+
+
 @dataclass(slots=True, frozen=True)
 class Path:
     root: str
     parts: tuple[PartBase, ...]
 
     def __str__(self) -> str:
-        result = self.root
+        fragments = [self.root]
         for part in self.parts:
-            match part:
-                case AttributePart(name):
-                    result += f".{name}"
-                case ItemPart(key):
-                    result += f"[{key}]"
-                case _:
-                    msg = f"Unknown part type: {type(part)}"
-                    raise TypeError(msg)
-        return result
+            if type(part) is AttributePart:
+                fragments.append(f".{part.name}")
+            elif type(part) is ItemPart:
+                key = part.key
+                fragments.append(f"[{key}]" if isinstance(key, str) else f"[{','.join(key)}]")
+            else:
+                msg = f"Unknown part type: {type(part)}"
+                raise TypeError(msg)
+        return "".join(fragments)
 
     @classmethod
     def parse(cls, path_str: str) -> Self:
-        s = path_str.strip()
-
-        # Extract root by partitioning at the first occurrence of '.' or '['
-        root_len = len(s)
-        root = None
-        for sep in (".", "["):
-            root_candidate, sep_found, _parts_str_candidate = s.partition(sep)
-            if sep_found and len(root_candidate) < root_len:
-                root_len = len(root_candidate)
-                root = root_candidate
-
-        if root is None:
+        return _parse_cached(cls, path_str.strip())  # type: ignore[no-any-return, arg-type]
+
+    @classmethod
+    def _parse_uncached(cls, s: str) -> Self:
+        # Extract root by splitting at the first occurrence of '.' or '['
+        i_dot = s.find(".")
+        i_bracket = s.find("[")
+        if i_dot < 0 and i_bracket < 0:
             return cls(root=s, parts=())
+        root_len = min(i for i in (i_dot, i_bracket) if i >= 0)
 
+        root = s[:root_len]
         s = s[root_len:]
 
         parts: list[PartBase] = []
-        i = 0
-        while i < len(s):
-            if s[i] == ".":  # Attribute access
-                i += 1
-                start = i
-                while i < len(s) and s[i] not in ".[":
-                    i += 1
-                name = s[start:i]
-                parts.append(AttributePart(name=name))
-            elif s[i] == "[":  # Item access
-                i += 1
-                start = i
-                while i < len(s) and s[i] != "]":
-                    i += 1
-                key_str = s[start:i]
+        pos = 0
+        for match in _TOKEN_RE.finditer(s):
+            if match.start() != pos:
+                msg = f"Unexpected character at position {pos}: {s[pos]}"
+                raise ValueError(msg)
+            name = match.group(1)
+            if name is not None:  # Attribute access
+                parts.append(_mk_attr(name))
+            else:  # Item access
+                key_str = match.group(2)
                 if "," in key_str:
                     keys = tuple(k.strip() for k in key_str.split(","))
-                    parts.append(ItemPart(key=keys))
+                    parts.append(_mk_item(keys))
                 else:
-                    parts.append(ItemPart(key=key_str.strip()))
-                i += 1  # Skip the closing ']'
-            else:
-                msg = f"Unexpected character at position {i}: {s[i]}"
-                raise ValueError(msg)
+                    parts.append(_mk_item(key_str.strip()))
+            pos = match.end()
+
+        if pos != len(s):
+            msg = f"Unexpected character at position {pos}: {s[pos]}"
+            raise ValueError(msg)
 
         return cls(root=root, parts=tuple(parts))
 
 
+@lru_cache(maxsize=1024)
+def _parse_cached[PathT: Path](cls: type[PathT], s: str) -> PathT:
+    """Memoize parsed paths so repeated path strings share one frozen instance."""
+    return cls._parse_uncached(s)
+
+
 @dataclass(slots=True, frozen=True)
 class ModelPath(Path):
     root: str
@@ -145,6 +163,7 @@ class VerificationPath(Path):
         return self.root[len(self.PREFIX) :]
 
 
+@lru_cache(maxsize=4096)
 def parse_path(path_str: str) -> ModelPath | CalcPath | VerificationPath:
     s = path_str.strip()
     if s.startswith(ModelPath.ROOT_SYMBOL):
@@ -161,24 +180,87 @@ def parse_path(path_str: str) -> ModelPath | CalcPath | VerificationPath:
 class ProjectPath:
     scope: str
     path: ModelPath | CalcPath | VerificationPath
+    # ProjectPath is hashed on every result/graph dict operation; computing
+    # the hash once at construction beats rehashing the nested path each time.
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_hash", hash((self.scope, self.path)))
+
+    def __hash__(self) -> int:
+        return self._hash
 
     def __str__(self) -> str:
         return f"{self.scope}::{self.path}"
 
 
-def iter_leaf_path_parts(  # noqa: PLR0912, C901
-    model: Any,
-    *,
-    _current_path_parts: tuple[PartBase, ...] = (),
-) -> Generator[tuple[PartBase, ...]]:
+class _Kind(IntEnum):
+    LEAF = 0
+    TABLE = 1
+    MODEL = 2
+
+
+@cache
+def _kind(t: Any) -> _Kind:
+    """Classify a type once so traversals skip repeated issubclass MRO walks."""
+    if not isclass(t):
+        return _Kind.LEAF
+    if issubclass(t, Table):
+        return _Kind.TABLE
+    if issubclass(t, BaseModel):
+        return _Kind.MODEL
+    return _Kind.LEAF
+
+
+@cache
+def _type_hints(model: type[BaseModel]) -> dict[str, Any]:
+    """Resolve a class's annotations with get_type_hints, once per class."""
+    return get_type_hints(model)
+
+
+@cache
+def _resolved_fields(model: type[BaseModel]) -> tuple[tuple[str, Any], ...]:
+    """Resolve field annotations once per model class, evaluating ForwardRefs eagerly."""
+    # Let pydantic resolve any pending forward references model-wide first;
+    # the per-field evaluate()/get_type_hints below are only fallbacks.
+    model.model_rebuild(raise_errors=False)
+    fields: list[tuple[str, Any]] = []
+    for field_name, field_info in model.model_fields.items():
+        field_type = field_info.annotation
+        if isinstance(field_type, ForwardRef):
+            field_type = field_type.evaluate()
+        elif isinstance(field_type, str):
+            field_type = _type_hints(model).get(field_name, field_type)
+        if field_type is None:
+            continue
+        fields.append((field_name, field_type))
+    return tuple(fields)
+
+
+# Models whose suffixes are currently being built; used to cut cycles in
+# self-referential model graphs.
+_models_in_progress: set[Any] = set()
+
+
+def iter_leaf_path_parts(model: Any) -> Generator[tuple[PartBase, ...]]:
+    yield from _leaf_suffixes(model)
+
+
+@cache
+def _leaf_suffixes(model: Any) -> tuple[tuple[PartBase, ...], ...]:  # noqa: C901
+    """Compute the leaf path parts of a type, once per type.
+
+    Sub-model suffixes are themselves cached, so shared submodels are
+    walked a single time process-wide and merely prefixed thereafter.
+    """
     if isinstance(model, ForwardRef):
         model = model.evaluate()
 
     # Handle generic aliases (e.g., Table[Option, float])
     origin = get_origin(model)
     if (origin is not None and origin is Table) or (isclass(origin) and issubclass(origin, Table)):
-        # Yield the whole table first
-        yield _current_path_parts
+        # The whole table first
+        suffixes: list[tuple[PartBase, ...]] = [()]
 
         # Extract type arguments from the generic Table
         type_args = get_args(model)
@@ -194,92 +276,113 @@ def iter_leaf_path_parts(  # noqa: PLR0912, C901
                 # Single StrEnum key
                 enum_type = enum_types[0]
                 if isclass(enum_type) and issubclass(enum_type, StrEnum):
-                    for enum_value in enum_type:
-                        yield (
-                            *_current_path_parts,
-                            ItemPart(key=enum_value.value),
-                        )
+                    suffixes.extend((_mk_item(enum_value.value),) for enum_value in enum_type)
             # Tuple of StrEnum keys
             elif all(isclass(et) and issubclass(et, StrEnum) for et in enum_types):
                 for values in product(*(list(et) for et in enum_types)):
                     key = ",".join(v.value for v in values)
-                    yield (
-                        *_current_path_parts,
-                        ItemPart(key=key),
-                    )
-        return
+                    suffixes.append((_mk_item(key),))
+        return tuple(suffixes)
+
+    # Non-generic Table classes (shouldn't normally happen) are also leaves;
+    # a properly parameterized Table is handled above.
+    if _kind(model) is not _Kind.MODEL:
+        return ((),)
+
+    suffixes = []
+    _models_in_progress.add(model)
+    try:
+        for field_name, field_type in _resolved_fields(model):
+            attr = _mk_attr(field_name)
+            if field_type in _models_in_progress:
+                # Self-referential model: treat the back-reference as a leaf
+                # to keep the walk finite.
+                suffixes.append((attr,))
+                continue
+            # Emit plain leaf fields directly; only recurse into types that
+            # can expand (models, tables, generic aliases, forward refs).
+            if (
+                _kind(field_type) is _Kind.LEAF
+                and get_origin(field_type) is None
+                and not isinstance(field_type, ForwardRef)
+            ):
+                suffixes.append((attr,))
+                continue
+            suffixes.extend((attr, *suffix) for suffix in _leaf_suffixes(field_type))
+    finally:
+        _models_in_progress.discard(model)
+    return tuple(suffixes)
+
+
+def iter_leaf_values(model: Any, data: Any) -> Generator[tuple[tuple[PartBase, ...], Any]]:
+    """Walk a value once against its type, yielding (leaf path parts, value) pairs.
+
+    Produces the same paths as ``iter_leaf_path_parts(model)`` without
+    re-walking the object from the root for every leaf.
+    """
+    yield from _iter_leaf_values(model, data, [])
+
+
+def _iter_leaf_values(
+    model: Any,
+    data: Any,
+    stack: list[PartBase],
+) -> Generator[tuple[tuple[PartBase, ...], Any]]:
+    if isinstance(model, ForwardRef):
+        model = model.evaluate()
 
-    if not isclass(model):
-        yield _current_path_parts
-        return
-    if issubclass(model, Table):
-        # This branch handles non-generic Table classes (shouldn't normally happen)
-        # For a properly parameterized Table, we handle it above
-        yield _current_path_parts
+    origin = get_origin(model)
+    if (origin is not None and origin is Table) or (isclass(origin) and issubclass(origin, Table)):
+        # Yield the whole table first, then its items
+        yield tuple(stack), data
+        if len(get_args(model)) == 2:
+            for key, value in data.items():
+                yield (*stack, _mk_item(Table._serialize_key(key))), value  # noqa: SLF001
         return
-    if not issubclass(model, BaseModel):
-        yield _current_path_parts
+
+    if _kind(model) is not _Kind.MODEL:
+        yield tuple(stack), data
         return
 
-    for field_name, field_info in model.model_fields.items():
-        field_type = field_info.annotation
-        if isinstance(field_type, ForwardRef):
-            field_type = field_type.evaluate()
-        if field_type is None:
-            continue
-        yield from iter_leaf_path_parts(
-            field_type,
-            _current_path_parts=(*_current_path_parts, AttributePart(name=field_name)),
-        )
-
-
-def get_value_by_parts(data: BaseModel, parts: tuple[PartBase, ...]) -> Any:
-    current: Any = data
-    for part in parts:
-        match part:
-            case AttributePart(name):
-                current = getattr(current, name)
-            case ItemPart(key):
-                # If accessing a Table, convert string key(s) to enum(s)
-                if isinstance(current, Table):
-                    key_type = current.key_type
-                    # Check if the key type is tuple (for multi-enum keys)
-                    if key_type is tuple:
-                        # Tuple key - get the enum types from the key sample
-                        key_sample = next(iter(current.keys()))
-                        enum_types = tuple(type(k) for k in key_sample)
-                        # Parse the string key
-                        parts_str = key if isinstance(key, tuple) else key.split(",")
-                        # Convert to enum tuple
-                        key = tuple(enum_type(part) for enum_type, part in zip(enum_types, parts_str, strict=True))
-                    else:
-                        # Single enum key
-                        key = key_type(key)
-                current = current[key]
-            case _:
-                msg = f"Unknown part type: {type(part)}"
-                raise TypeError(msg)
-    return current
+    for field_name, field_type in _resolved_fields(model):
+        stack.append(_mk_attr(field_name))
+        yield from _iter_leaf_values(field_type, getattr(data, field_name), stack)
+        stack.pop()
+
 
+def hydrate_value_by_leaf_values[T](model: type[T], leaf_values: Mapping[tuple[PartBase, ...], Any]) -> T:
+    return _make_hydrator(model)(leaf_values)  # type: ignore[no-any-return, arg-type]
 
-def hydrate_value_by_leaf_values[T](model: type[T], leaf_values: Mapping[tuple[PartBase, ...], Any]) -> T:  # noqa: PLR0912, C901, PLR0915
-    # If there's a value at the empty path (), it represents the complete object
-    # This happens when we store both the whole Table and individual items
-    if () in leaf_values:
-        return leaf_values[()]  # type: ignore[no-any-return]
 
+_EMPTY_LEAF_VALUES: dict[tuple[PartBase, ...], Any] = {}
+
+type _Hydrator = Callable[[Mapping[tuple[PartBase, ...], Any]], Any]
+
+
+@cache
+def _make_hydrator(model: Any) -> _Hydrator:  # noqa: C901, PLR0915
+    """Specialize a hydration closure for a type, doing all reflection once per type.
+
+    Every closure first honors a value at the empty path (), which represents
+    the complete object (stored alongside individual Table items).
+    """
     # Handle generic Table types (e.g., Table[Option, float])
     origin = get_origin(model)
     if origin is not None and (origin is Table or (isclass(origin) and issubclass(origin, Table))):
         # Extract type arguments to get the key type
         type_args = get_args(model)
-        if len(type_args) == 2:
-            key_type_arg, _value_type_arg = type_args
-
-            # Determine the actual enum type(s)
-            key_type_args = get_args(key_type_arg)
-            enum_types = key_type_args if key_type_args else (key_type_arg,)
-
+        if len(type_args) != 2:
+            msg = f"Table type must have exactly 2 type arguments, got {len(type_args)}"
+            raise TypeError(msg)
+        key_type_arg, _value_type_arg = type_args
+
+        # Determine the actual enum type(s)
+        key_type_args = get_args(key_type_arg)
+        enum_types = key_type_args if key_type_args else (key_type_arg,)
+
+        def hydrate_generic_table(leaf_values: Mapping[tuple[PartBase, ...], Any]) -> Any:
+            if () in leaf_values:
+                return leaf_values[()]
             table_mapping = {}
             for parts, value in leaf_values.items():
                 key_part = parts[0]
@@ -291,75 +394,75 @@ def hydrate_value_by_leaf_values[T](model: type[T], leaf_values: Mapping[tuple[P
                 # Deserialize the key based on whether it's a tuple or single enum
                 if len(enum_types) == 1:
                     # Single StrEnum key
-                    enum_type = enum_types[0]
-                    key = enum_type(str_key)
+                    key = enum_types[0](str_key)
                 else:
                     # Tuple of StrEnum keys
                     parts_str = str_key.split(",") if isinstance(str_key, str) else str_key
-                    if isinstance(parts_str, str):
-                        parts_str = [parts_str]
                     key = tuple(enum_type(part) for enum_type, part in zip(enum_types, parts_str, strict=True))
 
                 table_mapping[key] = value
-            return origin(table_mapping)  # type: ignore[no-any-return]
-        msg = f"Table type must have exactly 2 type arguments, got {len(type_args)}"
-        raise TypeError(msg)
+            return origin(table_mapping)
 
-    if isclass(model) and issubclass(model, Table):
-        table_mapping = {}
-        for parts, value in leaf_values.items():
-            key_part = parts[0]
-            if not isinstance(key_part, ItemPart):
-                msg = f"Expected ItemPart for Table key, got: {type(key_part)}"
-                raise TypeError(msg)
-            key = key_part.key
-            table_mapping[key] = value
-        return model(table_mapping)
-
-    if not isclass(model) or not issubclass(model, BaseModel):
-        if len(leaf_values) != 1 or any(len(parts) != 0 for parts in leaf_values):
-            msg = f"Expected single leaf value for non-model type '{model}', got: {leaf_values}"
-            raise ValueError(msg)
-        return next(iter(leaf_values.values()))  # type: ignore[no-any-return]
-
-    field_values: dict[str, Any] = {}
+        return hydrate_generic_table
 
-    for field_name, field_info in model.model_fields.items():
-        field_type = field_info.annotation
-        if isinstance(field_type, ForwardRef):
-            field_type = field_type.evaluate()
-        if field_type is None:
-            continue
+    kind = _kind(model)
+    if kind is _Kind.TABLE:
 
-        matching_leaf_parts = [
-            parts
-            for parts in leaf_values
-            if len(parts) > 0 and isinstance(parts[0], AttributePart) and parts[0].name == field_name
-        ]
-        logger.debug(f"Hydrating field '{field_name}' of type '{field_type}' with leaf parts: {matching_leaf_parts}")
-        logger.debug(f"Available leaf values: {leaf_values}")
-
-        field_value: Any
-        if issubclass(field_type, BaseModel):
-            sub_leaf_values = {tuple(parts[1:]): leaf_values[parts] for parts in matching_leaf_parts}
-            field_value = hydrate_value_by_leaf_values(field_type, sub_leaf_values)
-        elif issubclass(field_type, Table):
+        def hydrate_table(leaf_values: Mapping[tuple[PartBase, ...], Any]) -> Any:
+            if () in leaf_values:
+                return leaf_values[()]
             table_mapping = {}
-            for parts in matching_leaf_parts:
-                key_part = parts[1]
+            for parts, value in leaf_values.items():
+                key_part = parts[0]
                 if not isinstance(key_part, ItemPart):
                     msg = f"Expected ItemPart for Table key, got: {type(key_part)}"
                     raise TypeError(msg)
-                key = key_part.key
-                value = leaf_values[parts]
-                table_mapping[key] = value
-            field_value = field_type(table_mapping)
-        else:
-            if len(matching_leaf_parts) != 1 or len(matching_leaf_parts[0]) != 1:
-                msg = f"Expected single leaf part for field '{field_name}', got: {matching_leaf_parts}"
+                table_mapping[key_part.key] = value
+            return model(table_mapping)
+
+        return hydrate_table
+
+    if kind is not _Kind.MODEL:
+
+        def hydrate_leaf(leaf_values: Mapping[tuple[PartBase, ...], Any]) -> Any:
+            if () in leaf_values:
+                return leaf_values[()]
+            if len(leaf_values) != 1 or any(len(parts) != 0 for parts in leaf_values):
+                msg = f"Expected single leaf value for non-model type '{model}', got: {leaf_values}"
                 raise ValueError(msg)
-            field_value = leaf_values[matching_leaf_parts[0]]
+            return next(iter(leaf_values.values()))
 
-        field_values[field_name] = field_value
+        return hydrate_leaf
+
+    # Precompute field kinds so the closure only does bucketing and dispatch.
+    # Sub-hydrators are resolved lazily through the cache to tolerate
+    # self-referential models.
+    field_specs = tuple(
+        (field_name, _kind(field_type), field_type) for field_name, field_type in _resolved_fields(model)
+    )
+
+    def hydrate_model(leaf_values: Mapping[tuple[PartBase, ...], Any]) -> Any:
+        if () in leaf_values:
+            return leaf_values[()]
+
+        # Bucket leaf values by their leading attribute once, instead of
+        # scanning every leaf key again for each field.
+        buckets: defaultdict[str, dict[tuple[PartBase, ...], Any]] = defaultdict(dict)
+        for parts, value in leaf_values.items():
+            head = parts[0]
+            if isinstance(head, AttributePart):
+                buckets[head.name][parts[1:]] = value
+
+        field_values: dict[str, Any] = {}
+        for field_name, field_kind, field_type in field_specs:
+            sub_leaf_values = buckets.get(field_name, _EMPTY_LEAF_VALUES)
+            if field_kind is _Kind.LEAF and get_origin(field_type) is None:
+                if len(sub_leaf_values) != 1 or next(iter(sub_leaf_values)) != ():
+                    msg = f"Expected single leaf part for field '{field_name}', got: {list(sub_leaf_values)}"
+                    raise ValueError(msg)
+                field_values[field_name] = next(iter(sub_leaf_values.values()))
+            else:
+                field_values[field_name] = _make_hydrator(field_type)(sub_leaf_values)
+        return model(**field_values)
 
-    return model(**field_values)
+    return hydrate_model
@@ -1,4 +1,5 @@
 from enum import StrEnum
+from functools import cache
 from itertools import product
 from typing import TYPE_CHECKING, Any, get_args
 
@@ -11,6 +12,14 @@ if TYPE_CHECKING:
     from pydantic_core import CoreSchema
 
 
+@cache
+def _expected_keys(key_types: tuple[type[StrEnum], ...]) -> frozenset[Any]:
+    """Build the exhaustive key set for a key-type combination, once per combination."""
+    if len(key_types) == 1:
+        return frozenset(key_types[0])
+    return frozenset(product(*key_types))
+
+
 class Table[K: (StrEnum, tuple[StrEnum, ...]), V](dict[K, V]):
     """Exhaustive mapping from keys of type K to values of type V."""
 
@@ -137,28 +146,23 @@ class Table[K: (StrEnum, tuple[StrEnum, ...]), V](dict[K, V]):
                 if not issubclass(key_type, StrEnum):
                     msg = f"Table key types must be StrEnum or tuple of StrEnum. Got: {key_types}"
                     raise TypeError(msg)
-            expected_keys = frozenset(
-                tuple(values)
-                for values in product(
-                    *(list(key_type) for key_type in key_types),
-                )
-            )
+            expected_keys = _expected_keys(key_types)
         else:
             key_type = type(key_sample)
             if not issubclass(key_type, StrEnum):
                 msg = f"Table key type must be StrEnum or tuple of StrEnum. Got: {key_type}"
                 raise TypeError(msg)
-            expected_keys = frozenset(key_type)
+            expected_keys = _expected_keys((key_type,))
 
         self._key_type = type(key_sample)
         self._expected_keys = expected_keys
 
-        missing_keys = expected_keys - set(mapping.keys())
+        missing_keys = expected_keys - mapping.keys()
         if missing_keys:
             msg = f"Table is missing keys: {missing_keys}"
             raise ValueError(msg)
 
-        disallowed_keys = set(mapping.keys()) - expected_keys
+        disallowed_keys = mapping.keys() - expected_keys
         if disallowed_keys:
             msg = f"Table has disallowed keys: {disallowed_keys}"
             raise ValueError(msg)
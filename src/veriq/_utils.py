@@ -1,4 +1,4 @@
-from collections import defaultdict, deque
+from collections import deque
 from collections.abc import Collection, Hashable, Mapping
 
 
@@ -11,20 +11,25 @@ def topological_sort[T: Hashable](dependencies: Mapping[T, Collection[T]]) -> li
 
     Copied from pdag.
     """
-    indegree: defaultdict[T, int] = defaultdict(int)
-    for node, deps in dependencies.items():
-        indegree[node] = indegree.get(node, 0)
+    indegree: dict[T, int] = dict.fromkeys(dependencies, 0)
+    indegree_get = indegree.get
+    for deps in dependencies.values():
         for dep in deps:
-            indegree[dep] += 1
-    q = deque([node for node, deg in indegree.items() if deg == 0])
-    order = []
+            indegree[dep] = indegree_get(dep, 0) + 1
+    q = deque(node for node, deg in indegree.items() if deg == 0)
+    order: list[T] = []
+    order_append = order.append
+    q_append = q.append
+    dependencies_get = dependencies.get
+    no_deps: tuple[T, ...] = ()
     while q:
         node = q.popleft()
-        order.append(node)
-        for dep in dependencies.get(node, []):
-            indegree[dep] -= 1
-            if indegree[dep] == 0:
-                q.append(dep)
+        order_append(node)
+        for dep in dependencies_get(node, no_deps):
+            deg = indegree[dep] - 1
+            indegree[dep] = deg
+            if deg == 0:
+                q_append(dep)
     if len(order) != len(indegree):
         msg = "Cycle detected in relationship dependencies!"
         raise ValueError(msg)
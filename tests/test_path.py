@@ -0,0 +1,74 @@
+"""Tests for the path parser in veriq._path."""
+
+import pytest
+
+from veriq._path import (
+    AttributePart,
+    CalcPath,
+    ItemPart,
+    ModelPath,
+    VerificationPath,
+    parse_path,
+)
+
+
+def test_parse_model_path() -> None:
+    """Test that a model path string parses into the expected parts."""
+    path = parse_path("$.sub.a")
+    assert isinstance(path, ModelPath)
+    assert path.root == "$"
+    assert path.parts == (AttributePart(name="sub"), AttributePart(name="a"))
+
+
+def test_parse_calc_path() -> None:
+    """Test that a calc path string parses into a CalcPath with its name."""
+    path = parse_path("@my_calc.out")
+    assert isinstance(path, CalcPath)
+    assert path.calc_name == "my_calc"
+    assert path.parts == (AttributePart(name="out"),)
+
+
+def test_parse_verification_path() -> None:
+    """Test that a verification path string parses into a VerificationPath."""
+    path = parse_path("?check_total")
+    assert isinstance(path, VerificationPath)
+    assert path.verification_name == "check_total"
+    assert path.parts == ()
+
+
+def test_parse_item_parts() -> None:
+    """Test that bracketed keys parse into ItemPart, including tuple keys."""
+    path = parse_path("$.table[nominal]")
+    assert path.parts == (AttributePart(name="table"), ItemPart(key="nominal"))
+
+    path = parse_path("$.table[nominal,option_a]")
+    assert path.parts == (
+        AttributePart(name="table"),
+        ItemPart(key=("nominal", "option_a")),
+    )
+
+
+@pytest.mark.parametrize(
+    "path_str",
+    [
+        "$.sub.a",
+        "@my_calc.out[nominal]",
+        "?check_total",
+        "$.table[nominal,option_a]",
+    ],
+)
+def test_parse_str_roundtrip(path_str: str) -> None:
+    """Test that parsing and stringifying a path round-trips."""
+    assert str(parse_path(path_str)) == path_str
+
+
+def test_parse_rejects_unknown_root() -> None:
+    """Test that a path without a recognized root symbol is rejected."""
+    with pytest.raises(ValueError, match="Unknown path type"):
+        parse_path("sub.a")
+
+
+def test_parse_rejects_malformed_parts() -> None:
+    """Test that stray characters between parts are rejected."""
+    with pytest.raises(ValueError, match="Unexpected character"):
+        ModelPath.parse("$.sub..a")